@@ -3,6 +3,7 @@ from .azcopy_utilities import (
     AzRemoteSASLocation,
     AzLocalLocation,
     AzCopyOptions,
+    AzCopyBatch,
     AzCopyJobInfo,
     AzSyncOptions,
     AzSyncJobInfo,
@@ -18,6 +19,7 @@ __all__ = [
     "AzRemoteSASLocation",
     "AzLocalLocation", 
     "AzCopyOptions",
+    "AzCopyBatch",
     "AzCopyJobInfo",
     "AzSyncOptions",
     "AzSyncJobInfo",
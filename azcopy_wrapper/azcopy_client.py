@@ -1,14 +1,22 @@
 import re
 import os
+import sys
+import copy
+import asyncio
+import functools
+import tempfile
 import warnings
+import weakref
 
-from typing import Optional, Union
+from typing import Any, Callable, List, Optional, Tuple, TypeVar, Union
 from azcopy_wrapper.azcopy_summary import (
     get_transfer_copy_summary_info,
     get_sync_summary_info,
     get_remove_summary_info,
+    get_list_text_items,
 )
 from azcopy_wrapper.azcopy_utilities import (
+    AzCopyBatch,
     AzCopyJobInfo,
     AzCopyOptions,
     AzLocalLocation,
@@ -22,8 +30,174 @@ from azcopy_wrapper.azcopy_utilities import (
     LocationType,
 )
 from azcopy_wrapper.sas_token_validation import is_sas_token_session_expired
+from azcopy_wrapper.utils.constants import (
+    DEFAULT_MAX_PARALLEL_JOBS,
+    MAX_PARALLEL_JOBS_ENV,
+)
 from azcopy_wrapper.utils.execute_command import execute_command
 
+try:
+    # orjson is an optional dependency which parses the
+    # JSON output of azcopy list much faster than json
+    import orjson as _json
+except ImportError:
+    import json as _json  # type: ignore
+
+_json_loads = _json.loads
+
+# Matches the progress lines sent by azcopy, for ex.
+# 45.5 %, 0 Done, 0 Failed, 2 Pending, 0 Skipped, 2 Total, ...
+_PERCENT_RE = re.compile(r"(?P<percent_complete>\d+\.\d+) %,")
+
+# Matches the line after which azcopy sends the job summary, in any case,
+# for ex. Job 1234-abcd summary for copy and remove, and
+# Job 1234-abcd Summary for sync
+_JOB_SUMMARY_RE = re.compile(r"Job\s+\S+\s+summary", re.IGNORECASE)
+
+# Matches the last line of the job summary, for ex.
+# Final Job Status: Completed
+_FINAL_STATUS_RE = re.compile(r"Final Job Status:\s*(.*)")
+
+_AUTHENTICATION_FAILED = "AuthenticationFailed"
+
+# Translation table to remove the brackets from the sync job summary
+_SYNC_STRIP = str.maketrans("", "", "()")
+
+# Semaphores limiting the number of azcopy jobs run in
+# parallel by the async methods, one for each event loop
+_job_semaphores = weakref.WeakKeyDictionary()  # type: ignore
+
+_JobInfo = TypeVar("_JobInfo")
+
+# Final job statuses sent by azcopy, from the best to the worst
+_JOB_STATUSES_BY_SEVERITY = (
+    "Completed",
+    "CompletedWithSkipped",
+    "CompletedWithErrors",
+    "CompletedWithErrorsAndSkipped",
+    "Failed",
+    "Cancelled",
+)
+
+# Counters of the copy job info which are summed for the jobs of a batch
+_COPY_JOB_COUNTERS = (
+    "number_of_file_transfers",
+    "number_of_folder_property_transfers",
+    "total_number_of_transfers",
+    "number_of_transfers_completed",
+    "number_of_transfers_failed",
+    "number_of_transfers_skipped",
+    "total_bytes_transferred",
+)
+
+
+def _extract_sas_token(
+    *locations: Union[AzRemoteSASLocation, AzLocalLocation]
+) -> str:
+    """
+    Returns the SAS token of the first remote location from the given locations
+    """
+    for location in locations:
+        if isinstance(location, AzRemoteSASLocation):
+            return location.sas_token
+
+    return ""
+
+
+def _validate_locations(
+    *locations: Union[AzRemoteSASLocation, AzLocalLocation]
+) -> None:
+    """
+    Checks that the SAS tokens of the remote locations are not expired
+    before they are used in a command
+    """
+    for location in locations:
+        if isinstance(location, AzRemoteSASLocation):
+            location.validate()
+
+
+def _get_job_status_severity(final_job_status_msg: str) -> int:
+    """
+    Returns the rank of the final job status, an unknown status being the worst
+    """
+    try:
+        return _JOB_STATUSES_BY_SEVERITY.index(final_job_status_msg)
+    except ValueError:
+        return len(_JOB_STATUSES_BY_SEVERITY)
+
+
+def _merge_copy_job_infos(job_infos: List[AzCopyJobInfo]) -> AzCopyJobInfo:
+    """
+    Combines the job infos of the jobs of a copy batch into a single job info
+    The batch is completed if all its jobs are, and has the worst final status of its jobs
+    The percent histories of the jobs are concatenated in the order the jobs ran
+    """
+    merged_job_info = AzCopyJobInfo(
+        final_job_status_msg=max(
+            (job_info.final_job_status_msg for job_info in job_infos),
+            key=_get_job_status_severity,
+            default="Completed",
+        ),
+        completed=all(job_info.completed for job_info in job_infos),
+    )
+
+    # The batch is only as far as its least complete job
+    if job_infos:
+        merged_job_info.percent_complete = min(
+            job_info.percent_complete for job_info in job_infos
+        )
+
+    for job_info in job_infos:
+        merged_job_info.percent_history_bp.extend(job_info.percent_history_bp)
+
+    for counter in _COPY_JOB_COUNTERS:
+        setattr(
+            merged_job_info,
+            counter,
+            sum(getattr(job_info, counter) for job_info in job_infos),
+        )
+
+    return merged_job_info
+
+
+def _get_max_parallel_jobs() -> int:
+    """
+    Reads the maximum number of parallel async jobs from the environment,
+    falling back to the default if the value is not a positive integer
+    """
+    max_parallel_jobs = os.environ.get(MAX_PARALLEL_JOBS_ENV)
+
+    if max_parallel_jobs is None:
+        return DEFAULT_MAX_PARALLEL_JOBS
+
+    try:
+        max_parallel_jobs_value = int(max_parallel_jobs)
+    except ValueError:
+        max_parallel_jobs_value = 0
+
+    if max_parallel_jobs_value < 1:
+        warnings.warn(
+            f"Invalid {MAX_PARALLEL_JOBS_ENV} value {max_parallel_jobs!r}, "
+            f"using {DEFAULT_MAX_PARALLEL_JOBS} parallel jobs"
+        )
+        return DEFAULT_MAX_PARALLEL_JOBS
+
+    return max_parallel_jobs_value
+
+
+def _get_job_semaphore() -> asyncio.Semaphore:
+    """
+    Returns the semaphore of the running event loop for the async jobs
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _job_semaphores.get(loop)
+
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_get_max_parallel_jobs())
+        _job_semaphores[loop] = semaphore
+
+    return semaphore
+
 
 class AzClient:
     """
@@ -45,6 +219,122 @@ class AzClient:
         self.exe_to_use = exe_to_use
         self.artefact_dir = artefact_dir
 
+    def _run_streaming_job(
+        self,
+        cmd: List[str],
+        job_info: Union[AzCopyJobInfo, AzSyncJobInfo, AzRemoveJobInfo],
+    ) -> Tuple[str, Optional[Exception]]:
+        """
+        Executes the azcopy command while sending its output, and updates
+        the percent complete, error and final job status of the job info
+
+        Returns the job summary text sent by azcopy along with the
+        exception raised while executing the command, if any
+        """
+        # Echoing the azcopy output through the bound write method
+        # instead of print to keep the per line overhead low
+        write_output = sys.stdout.write
+
+        summary_parts = []
+        # A boolean flag to be set as True when
+        # azcopy starts sending summary information
+        unlock_summary = False
+        # azcopy keeps sending the same percent value until the
+        # transfer progresses, so the value is only converted
+        # and updated in the job_info when it changes
+        last_percent_text = ""
+        append_percent_history = job_info.percent_history_bp.append
+
+        try:
+            for output_line in execute_command(cmd):
+                write_output(output_line)
+
+                # If azcopy has started sending summary then
+                # appending it to summary text. The summary lines
+                # don't have any progress or error info, so only
+                # the final job status needs to be checked
+                if unlock_summary:
+                    summary_parts.append(output_line)
+
+                    final_status_match = _FINAL_STATUS_RE.match(output_line)
+
+                    if final_status_match is not None:
+                        final_status = final_status_match.group(1)
+                        job_info.final_job_status_msg = final_status.strip()
+
+                    continue
+
+                # The first character of the line is used to skip the
+                # checks which cannot match it. A line matched by one of
+                # the checks below doesn't need the remaining checks
+                first_char = output_line[:1]
+
+                # Extracting the percent complete information from the
+                # current output line and updating it in the job_info.
+                # Progress lines always start with the percent value
+                if first_char.isdigit():
+                    transfer_match = _PERCENT_RE.match(output_line)
+
+                    if transfer_match is not None:
+                        percent_text = transfer_match.group(1)
+
+                        if percent_text != last_percent_text:
+                            last_percent_text = percent_text
+                            job_info.percent_complete = float(percent_text)
+                            # Clamping the value to 100 %, the range
+                            # which fits in the unsigned short array
+                            append_percent_history(
+                                min(round(job_info.percent_complete * 100), 10000)
+                            )
+
+                        continue
+
+                # Job summary starts with line ->
+                # Job {job_id} summary (Job {job_id} Summary for sync)
+                elif first_char in ("J", "j"):
+                    if _JOB_SUMMARY_RE.match(output_line) is not None:
+                        unlock_summary = True
+                        continue
+
+                elif first_char == "F":
+                    final_status_match = _FINAL_STATUS_RE.match(output_line)
+
+                    if final_status_match is not None:
+                        final_status = final_status_match.group(1)
+                        job_info.final_job_status_msg = final_status.strip()
+                        continue
+
+                # Any other line can contain the authentication error,
+                # for ex. Failed to perform copy: ... AuthenticationFailed
+                if _AUTHENTICATION_FAILED in output_line:
+                    job_info.error_msg = output_line
+
+        except Exception as e:
+            return "".join(summary_parts), e
+
+        finally:
+            # The echoed output is flushed even if the command failed
+            sys.stdout.flush()
+
+        return "".join(summary_parts), None
+
+    def _write_list_of_files(self, paths: List[str]) -> str:
+        """
+        Writes the paths to a temporary file to be used with the --list-of-files option
+        The file is created in the artefact directory if it is specified
+
+        Returns the path of the file, which needs to be removed by the caller
+        """
+        fd, list_of_files = tempfile.mkstemp(
+            suffix=".txt", prefix="azcopy_list_of_files_", dir=self.artefact_dir
+        )
+
+        # azcopy reads the file as utf-8, whatever the locale encoding is
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("\n".join(paths))
+
+        return list_of_files
+
     def _copy(
         self,
         src: Union[AzRemoteSASLocation, AzLocalLocation],
@@ -55,7 +345,7 @@ class AzClient:
         Copies that data from source to destionation
         with the transfer options specified
         """
-        import re
+        _validate_locations(src, dest)
 
         # Generating the command to be used for subprocess
         cmd = [
@@ -63,66 +353,23 @@ class AzClient:
             "cp",
             str(src),
             str(dest),
-        ] + transfer_options.get_options_list()
+        ]
+        cmd.extend(transfer_options.get_options_list())
 
         # Creating AzCopyJobInfo object to store the job info
         job_info = AzCopyJobInfo()
 
-        try:
-            summary = ""
-            # A boolean flag to be set as True when
-            # azcopy starts sending summary information
-            unlock_summary = False
-
-            for output_line in execute_command(cmd):
-                print(output_line, end="")
-
-                # Extracting the percent complete information from the
-                # current output line and updating it in the job_info
-                if "%" in output_line:
+        summary, error = self._run_streaming_job(cmd, job_info)
 
-                    percent_expression = r"(?P<percent_complete>\d+\.\d+) %,"
-                    transfer_match = re.match(percent_expression, output_line)
-
-                    if transfer_match is not None:
-                        transfer_info = transfer_match.groupdict()
-
-                        job_info.percent_complete = float(
-                            transfer_info["percent_complete"]
-                        )
-
-                # If azcopy has started sending summary then
-                # appending it to summary text
-                if unlock_summary:
-                    summary += output_line
-
-                # Job summary starts with line ->
-                # Job {job_id} summary
-                if output_line.startswith("Job") and "summary" in output_line:
-                    unlock_summary = True
-
-                if "AuthenticationFailed" in output_line:
-                    job_info.error_msg = output_line
-
-                if "Final Job Status:" in output_line:
-                    job_info.final_job_status_msg = output_line.split(":")[-1].strip()
-
-        except Exception as e:
+        if error is not None:
             # Checking if the error is because of the sas token
-
-            if type(dest) == AzRemoteSASLocation:
-                token = str(dest.sas_token)
-            elif type(src) == AzRemoteSASLocation:
-                token = str(src.sas_token)
-            else:
-                token = ""
-
+            token = _extract_sas_token(dest, src)
             token_expiry_flag = is_sas_token_session_expired(token)
 
-            if token_expiry_flag == True:
+            if token_expiry_flag:
                 job_info.error_msg = "SAS token is expired"
             else:
-                job_info.error_msg = str(e)
+                job_info.error_msg = str(error)
 
             job_info.completed = False
 
@@ -157,64 +404,29 @@ class AzClient:
         Syncs that data from source to destionation
         with the transfer options specified
         """
+        _validate_locations(src, dest)
+
         # Generating the command to be used for subprocess
         cmd = [
             self.exe_to_use,
             "sync",
             str(src),
             str(dest),
-        ] + transfer_options.get_options_list()
+        ]
+        cmd.extend(transfer_options.get_options_list())
 
         # Creating AzSyncJobInfo object to store the job info
         job_info = AzSyncJobInfo()
 
-        try:
-            summary = ""
-            # A boolean flag to be set as True when
-            # azcopy starts sending summary information
-            unlock_summary = False
-
-            for output_line in execute_command(cmd):
-                print(output_line, end="")
-
-                # Extracting the percent complete information from the
-                # current output line and updating it in the job_info
-                if "%" in output_line:
-
-                    percent_expression = r"(?P<percent_complete>\d+\.\d+) %,"
-                    transfer_match = re.match(percent_expression, output_line)
-
-                    if transfer_match is not None:
-                        transfer_info = transfer_match.groupdict()
-
-                        job_info.percent_complete = float(
-                            transfer_info["percent_complete"]
-                        )
-
-                # If azcopy has started sending summary then
-                # appending it to summary text
-                if unlock_summary:
-                    summary += output_line.replace("(", "").replace(")", "")
-
-                # Job summary starts with line ->
-                # Job {job_id} summary
-                output_line_cleaned = output_line.strip().lower()
-
-                if (
-                    output_line_cleaned.startswith("job")
-                    and "summary" in output_line_cleaned
-                ):
-                    unlock_summary = True
-
-                if "AuthenticationFailed" in output_line:
-                    job_info.error_msg = output_line
-
-                if "Final Job Status:" in output_line:
-                    job_info.final_job_status_msg = output_line.split(":")[-1].strip()
+        summary, error = self._run_streaming_job(cmd, job_info)
 
-        except Exception as e:
+        if error is not None:
             job_info.completed = False
 
+        # Removing the brackets from the summary as the sync summary
+        # has keys like "Elapsed Time (Minutes)"
+        summary = summary.translate(_SYNC_STRIP)
+
         # Get the final job summary info
         job_info = get_sync_summary_info(job_info, summary)
 
@@ -245,58 +457,64 @@ class AzClient:
         Lists files and directories from a remote location
         with the list options specified
         """
-        import json
+        _validate_locations(location)
 
         # Generating the command to be used for subprocess
         cmd = [
             self.exe_to_use,
             "list",
             str(location),
-        ] + list_options.get_options_list()
+        ]
+        cmd.extend(list_options.get_options_list())
 
         # Creating AzListJobInfo object to store the job info
         job_info = AzListJobInfo()
         output_lines = []
+        items = []
+        parse_json = list_options.output_type == "json"
+        write_output = sys.stdout.write
 
         try:
             for output_line in execute_command(cmd):
-                print(output_line, end="")
-                output_lines.append(output_line.rstrip())
+                write_output(output_line)
+                output_line = output_line.rstrip()
+                output_lines.append(output_line)
 
                 # Check for authentication errors
-                if "AuthenticationFailed" in output_line:
+                if _AUTHENTICATION_FAILED in output_line:
                     job_info.error_msg = output_line
                     job_info.completed = False
                     raise Exception(job_info.error_msg)
 
+                # If output type is JSON, parse the line as it is received.
+                # AzCopy returns NDJSON format (one JSON object per line)
+                if parse_json:
+                    json_line = output_line.lstrip()
+
+                    if not (json_line.startswith("{") and json_line.endswith("}")):
+                        continue
+
+                    try:
+                        json_obj = _json_loads(json_line)
+                        # Extract the actual file info from MessageContent if it's a ListObject
+                        if json_obj.get("MessageType") == "ListObject":
+                            message_content = json_obj.get("MessageContent", "")
+                            if message_content:
+                                items.append(_json_loads(message_content))
+                        elif json_obj.get("MessageType") != "EndOfJob":
+                            # Include other non-EndOfJob message types
+                            items.append(json_obj)
+                    except (ValueError, TypeError):
+                        # If JSON parsing fails, the line is only kept in the raw text
+                        continue
+
             # Join all output lines
             job_info.output_text = "\n".join(output_lines)
 
-            # If output type is JSON, try to parse it
-            if list_options.output_type == "json":
-                try:
-                    # AzCopy returns NDJSON format (one JSON object per line)
-                    items = []
-                    for line in output_lines:
-                        line = line.strip()
-                        if line and line.startswith('{') and line.endswith('}'):
-                            try:
-                                json_obj = json.loads(line)
-                                # Extract the actual file info from MessageContent if it's a ListObject
-                                if json_obj.get("MessageType") == "ListObject":
-                                    message_content = json_obj.get("MessageContent", "")
-                                    if message_content:
-                                        file_info = json.loads(message_content)
-                                        items.append(file_info)
-                                elif json_obj.get("MessageType") != "EndOfJob":
-                                    # Include other non-EndOfJob message types
-                                    items.append(json_obj)
-                            except json.JSONDecodeError:
-                                continue
-                    job_info.items = items
-                except Exception:
-                    # If JSON parsing fails, keep the raw text
-                    pass
+            if parse_json:
+                job_info.items = items
+            else:
+                job_info.items = get_list_text_items(job_info.output_text)
 
             job_info.completed = True
             job_info.final_job_status_msg = "Completed"
@@ -307,6 +525,10 @@ class AzClient:
             job_info.completed = False
             raise Exception(job_info.error_msg)
 
+        finally:
+            # The echoed output is flushed even if the command failed
+            sys.stdout.flush()
+
         return job_info
 
     def _remove(
@@ -318,66 +540,30 @@ class AzClient:
         Removes files and directories from the remote location
         with the remove options specified
         """
-        import re
+        _validate_locations(location)
 
         # Generating the command to be used for subprocess
         cmd = [
             self.exe_to_use,
             "remove",
             str(location),
-        ] + remove_options.get_options_list()
+        ]
+        cmd.extend(remove_options.get_options_list())
 
         # Creating AzRemoveJobInfo object to store the job info
         job_info = AzRemoveJobInfo()
 
-        try:
-            summary = ""
-            # A boolean flag to be set as True when
-            # azcopy starts sending summary information
-            unlock_summary = False
-
-            for output_line in execute_command(cmd):
-                print(output_line, end="")
-
-                # Extracting the percent complete information from the
-                # current output line and updating it in the job_info
-                if "%" in output_line:
-
-                    percent_expression = r"(?P<percent_complete>\d+\.\d+) %,"
-                    transfer_match = re.match(percent_expression, output_line)
-
-                    if transfer_match is not None:
-                        transfer_info = transfer_match.groupdict()
-
-                        job_info.percent_complete = float(
-                            transfer_info["percent_complete"]
-                        )
-
-                # If azcopy has started sending summary then
-                # appending it to summary text
-                if unlock_summary:
-                    summary += output_line
-
-                # Job summary starts with line ->
-                # Job {job_id} summary
-                if output_line.startswith("Job") and "summary" in output_line:
-                    unlock_summary = True
-
-                if "AuthenticationFailed" in output_line:
-                    job_info.error_msg = output_line
+        summary, error = self._run_streaming_job(cmd, job_info)
 
-                if "Final Job Status:" in output_line:
-                    job_info.final_job_status_msg = output_line.split(":")[-1].strip()
-
-        except Exception as e:
+        if error is not None:
             # Checking if the error is because of the sas token
-            token = str(location.sas_token)
+            token = _extract_sas_token(location)
             token_expiry_flag = is_sas_token_session_expired(token)
 
-            if token_expiry_flag == True:
+            if token_expiry_flag:
                 job_info.error_msg = "SAS token is expired"
             else:
-                job_info.error_msg = str(e)
+                job_info.error_msg = str(error)
 
             job_info.completed = False
 
@@ -462,6 +648,99 @@ class AzClient:
     ) -> AzCopyJobInfo:
         return self._copy(src=src, dest=dest, transfer_options=transfer_options)
 
+    def batch_copy(
+        self,
+        src: Union[AzRemoteSASLocation, AzLocalLocation],
+        dest: Union[AzRemoteSASLocation, AzLocalLocation],
+        paths: List[str],
+        transfer_options: AzCopyOptions,
+    ) -> AzCopyJobInfo:
+        """
+        Copies multiple files from the source to the destination with a single azcopy job,
+        instead of running one job for each file.
+
+        Args:
+            src: The source location containing all the files
+            dest: The destination location
+            paths: Paths of the files to copy, relative to the source location
+            transfer_options: Options for the copy operation
+
+        Returns:
+            AzCopyJobInfo containing the results of the whole batch
+
+        Example:
+            remote_location = AzRemoteSASLocation(
+                storage_account="mystorageaccount",
+                container="mycontainer",
+                path="myfolder/",
+                sas_token="your_sas_token"
+            )
+
+            local_location = AzLocalLocation(path="./data/")
+
+            result = az_client.batch_copy(
+                remote_location,
+                local_location,
+                ["file1.txt", "subfolder/file2.txt"],
+                AzCopyOptions(),
+            )
+        """
+        list_of_files = self._write_list_of_files(paths)
+
+        try:
+            batch_options = copy.copy(transfer_options)
+            batch_options.list_of_files = list_of_files
+
+            return self._copy(src=src, dest=dest, transfer_options=batch_options)
+        finally:
+            os.remove(list_of_files)
+
+    def run_copy_batch(self, batch: AzCopyBatch) -> AzCopyJobInfo:
+        """
+        Copies all the files of the batch, with a single azcopy job for the
+        files having the same source folder and destination
+
+        The jobs are run one after the other, and the batch stops at the first
+        job which fails, raising its exception in the same way as batch_copy.
+        The files copied by the previous jobs are kept at the destination
+
+        Each file is copied directly into its destination, as when copying
+        the file on its own. The jobs are run with --as-subdir=false, as
+        azcopy otherwise copies the files of a job under a subfolder named
+        after their source folder
+
+        Args:
+            batch: The files to copy and the options for the copy operation
+
+        Returns:
+            AzCopyJobInfo with the counters of all the jobs of the batch summed
+
+        Example:
+            batch = AzCopyBatch(AzCopyOptions())
+
+            for blob_path in ["myfolder/file1.txt", "myfolder/file2.txt"]:
+                batch.add(
+                    AzRemoteSASLocation(
+                        storage_account="mystorageaccount",
+                        container="mycontainer",
+                        path=blob_path,
+                        sas_token="your_sas_token"
+                    ),
+                    AzLocalLocation(path="./data/"),
+                )
+
+            result = az_client.run_copy_batch(batch)
+        """
+        transfer_options = copy.copy(batch.transfer_options)
+        transfer_options.as_subdir = False
+
+        job_infos = [
+            self.batch_copy(src, dest, paths, transfer_options)
+            for src, dest, paths in batch.get_groups()
+        ]
+
+        return _merge_copy_job_infos(job_infos)
+
     ####################################################################
     # Sync Data
     ####################################################################
@@ -624,3 +903,189 @@ class AzClient:
         # Ensure recursive is set to True for directory removal
         remove_options.recursive = True
         return self._remove(location=location, remove_options=remove_options)
+
+    def batch_remove(
+        self,
+        location: AzRemoteSASLocation,
+        paths: List[str],
+        remove_options: AzRemoveOptions,
+    ) -> AzRemoveJobInfo:
+        """
+        Removes multiple files from a remote Azure Storage location with a single azcopy job,
+        instead of running one job for each file.
+
+        Args:
+            location: The remote Azure storage location containing all the files
+            paths: Paths of the files to remove, relative to the location
+            remove_options: Options for the remove operation
+
+        Returns:
+            AzRemoveJobInfo containing the results of the whole batch
+        """
+        list_of_files = self._write_list_of_files(paths)
+
+        try:
+            batch_options = copy.copy(remove_options)
+            batch_options.list_of_files = list_of_files
+
+            return self._remove(location=location, remove_options=batch_options)
+        finally:
+            os.remove(list_of_files)
+
+    ####################################################################
+    # Async
+    ####################################################################
+
+    async def _run_async(
+        self, job: Callable[..., _JobInfo], **kwargs: Any
+    ) -> _JobInfo:
+        """
+        Runs the blocking azcopy job in the default executor of the event loop,
+        so that multiple jobs can be awaited together, for ex. with asyncio.gather
+
+        At most 4 jobs are run at the same time by default, which can be
+        changed with the AZCOPY_WRAPPER_MAX_PARALLEL environment variable
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = _get_job_semaphore()
+
+        await semaphore.acquire()
+
+        try:
+            future = loop.run_in_executor(None, functools.partial(job, **kwargs))
+        except BaseException:
+            semaphore.release()
+            raise
+
+        def release_semaphore(done_future: "asyncio.Future[_JobInfo]") -> None:
+            semaphore.release()
+
+            # Marking the exception as retrieved, as nobody awaits
+            # the job anymore if the awaiting task was cancelled
+            if not done_future.cancelled():
+                done_future.exception()
+
+        # The azcopy job keeps running in its thread when the awaiting task is
+        # cancelled, so the job is shielded from the cancellation and its slot
+        # is only released once the job is done
+        future.add_done_callback(release_semaphore)
+
+        return await asyncio.shield(future)
+
+    async def download_data_to_local_location_async(
+        self,
+        src: AzRemoteSASLocation,
+        dest: AzLocalLocation,
+        transfer_options: AzCopyOptions,
+    ) -> AzCopyJobInfo:
+        """
+        Async version of download_data_to_local_location
+
+        Example:
+            jobs = [
+                az_client.download_data_to_local_location_async(
+                    src=remote_location, dest=local_location, transfer_options=transfer_options
+                )
+                for remote_location, local_location in locations
+            ]
+
+            job_infos = await asyncio.gather(*jobs)
+        """
+        return await self._run_async(
+            self.download_data_to_local_location,
+            src=src,
+            dest=dest,
+            transfer_options=transfer_options,
+        )
+
+    async def upload_data_to_remote_location_async(
+        self,
+        src: AzLocalLocation,
+        dest: AzRemoteSASLocation,
+        transfer_options: AzCopyOptions,
+    ) -> AzCopyJobInfo:
+        """
+        Async version of upload_data_to_remote_location
+        """
+        return await self._run_async(
+            self.upload_data_to_remote_location,
+            src=src,
+            dest=dest,
+            transfer_options=transfer_options,
+        )
+
+    async def copy_remote_data_from_container_to_container_async(
+        self,
+        src: AzRemoteSASLocation,
+        dest: AzRemoteSASLocation,
+        transfer_options: AzCopyOptions,
+    ) -> AzCopyJobInfo:
+        """
+        Async version of copy_remote_data_from_container_to_container
+        """
+        return await self._run_async(
+            self.copy_remote_data_from_container_to_container,
+            src=src,
+            dest=dest,
+            transfer_options=transfer_options,
+        )
+
+    async def sync_to_local_location_async(
+        self,
+        src: AzRemoteSASLocation,
+        dest: AzLocalLocation,
+        transfer_options: AzSyncOptions,
+    ) -> AzSyncJobInfo:
+        """
+        Async version of sync_to_local_location
+        """
+        return await self._run_async(
+            self.sync_to_local_location,
+            src=src,
+            dest=dest,
+            transfer_options=transfer_options,
+        )
+
+    async def sync_to_remote_location_async(
+        self,
+        src: AzLocalLocation,
+        dest: AzRemoteSASLocation,
+        transfer_options: AzSyncOptions,
+    ) -> AzSyncJobInfo:
+        """
+        Async version of sync_to_remote_location
+        """
+        return await self._run_async(
+            self.sync_to_remote_location,
+            src=src,
+            dest=dest,
+            transfer_options=transfer_options,
+        )
+
+    async def list_remote_location_async(
+        self,
+        location: AzRemoteSASLocation,
+        list_options: AzListOptions,
+    ) -> AzListJobInfo:
+        """
+        Async version of list_remote_location
+        """
+        return await self._run_async(
+            self.list_remote_location,
+            location=location,
+            list_options=list_options,
+        )
+
+    async def remove_from_remote_location_async(
+        self,
+        location: AzRemoteSASLocation,
+        remove_options: AzRemoveOptions,
+    ) -> AzRemoveJobInfo:
+        """
+        Async version of remove_from_remote_location
+        """
+        return await self._run_async(
+            self.remove_from_remote_location,
+            location=location,
+            remove_options=remove_options,
+        )
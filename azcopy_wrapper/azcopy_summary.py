@@ -1,5 +1,18 @@
 import re
-from azcopy_wrapper.azcopy_utilities import AzCopyJobInfo, AzSyncJobInfo, AzRemoveJobInfo
+
+from typing import List
+from azcopy_wrapper.azcopy_utilities import (
+    AzCopyJobInfo,
+    AzSyncJobInfo,
+    AzRemoveJobInfo,
+)
+
+# Matches the file lines of the azcopy list text output, for ex.
+# INFO: folder/file.txt; LastModifiedTime: 2023-01-01 00:00:00 +0000 GMT; Content Length: 1.00 KiB
+_LIST_TEXT_ITEM_RE = re.compile(
+    r"^INFO: (?P<path>[^;\n]+);(?P<properties>[^\n]*?)\s*Content Length: (?P<content_length>[^\n]+?)\s*$",
+    re.MULTILINE,
+)
 
 
 def get_property_value(key: str, job_summary: str) -> int:
@@ -140,3 +153,30 @@ def get_remove_summary_info(
     )
 
     return remove_job_info
+
+
+def get_list_text_items(output_text: str) -> List[dict]:
+    """
+    Extract the files from the text output of the Azcopy list command
+    """
+    items = []
+
+    for item_match in _LIST_TEXT_ITEM_RE.finditer(output_text):
+        item = {"Path": item_match.group("path")}
+
+        # Properties requested with the --properties option,
+        # sent as "Key: Value" pairs separated by semicolons
+        for item_property in item_match.group("properties").split(";"):
+            key, separator, value = item_property.partition(": ")
+
+            if separator:
+                item[key.strip()] = value.strip()
+
+        # Content length is in bytes only with the --machine-readable option,
+        # otherwise it is in a human readable form like 1.00 KiB. It is kept
+        # as a string in both cases, as in the JSON output
+        item["ContentLength"] = item_match.group("content_length")
+
+        items.append(item)
+
+    return items
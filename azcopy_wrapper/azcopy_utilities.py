@@ -1,6 +1,15 @@
-from typing import List, Optional
+import os
+import sys
+import math
+import time
 
-from azcopy_wrapper.sas_token_validation import is_sas_token_session_expired
+from array import array
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from azcopy_wrapper.sas_token_validation import get_sas_token_expiry_timestamp
 
 
 class LocationType:
@@ -14,6 +23,26 @@ class LocationType:
     DEST = "destination"
 
 
+@lru_cache(maxsize=256)
+def _get_resource_uri(storage_account: str, container: str) -> str:
+    """
+    Creates the container url, which is shared by all the
+    locations in the same storage account and container
+    """
+    return f"https://{storage_account}.blob.core.windows.net/{container}/"
+
+
+def _get_sas_token_expiry(sas_token: str) -> float:
+    """
+    Returns the session expiry timestamp of the SAS token,
+    a location without SAS token never expires
+    """
+    if not sas_token:
+        return math.inf
+
+    return get_sas_token_expiry_timestamp(sas_token)
+
+
 class AzRemoteSASLocation:
     """
     Class to create Azure Remote Location with SAS Token
@@ -21,6 +50,16 @@ class AzRemoteSASLocation:
     specified while creating the object
     """
 
+    __slots__ = (
+        "storage_account",
+        "container",
+        "path",
+        "use_wildcard",
+        "_sas_token",
+        "_sas_token_expiry",
+        "location_type",
+    )
+
     storage_account: str
     container: str
     path: str
@@ -37,39 +76,57 @@ class AzRemoteSASLocation:
         sas_token: str = "",
         location_type: str = None,
     ) -> None:
-        if len(sas_token) > 0:
-            sas_token_expiry_flag = is_sas_token_session_expired(token=sas_token)
-
-            if sas_token_expiry_flag == True:
-                raise Exception("SAS token is expired")
+        self.refresh_sas_token(sas_token)
 
         self.storage_account = storage_account
         self.container = container
-        self.sas_token = sas_token
         self.use_wildcard = use_wildcard
         self.path = path
         self.location_type = location_type
 
-    def get_resource_uri(self) -> str:
-        return f"https://{self.storage_account}.blob.core.windows.net/{self.container}/"
+    @property
+    def sas_token(self) -> str:
+        return self._sas_token
 
-    def __str__(self) -> str:
+    @sas_token.setter
+    def sas_token(self, sas_token: str) -> None:
+        # The session expiry is parsed once when the token is set,
+        # instead of every time the location url is created
+        self._sas_token_expiry = _get_sas_token_expiry(sas_token)
+        self._sas_token = sas_token
+
+    def refresh_sas_token(self, sas_token: str) -> None:
         """
-        Creates the remote location url with sas token to be used for the final location
+        Replaces the SAS token of the location, for ex. when the previous token expires
         """
-        if len(self.sas_token) > 0:
-            sas_token_expiry_flag = is_sas_token_session_expired(token=self.sas_token)
+        sas_token_expiry = _get_sas_token_expiry(sas_token)
+
+        if time.time() > sas_token_expiry:
+            raise Exception("SAS token is expired")
+
+        self._sas_token_expiry = sas_token_expiry
+        self._sas_token = sas_token
 
-            if sas_token_expiry_flag == True:
-                raise Exception("SAS token is expired")
+    def validate(self) -> None:
+        """
+        Raises an exception if the SAS token of the location is expired
+        """
+        if time.time() > self._sas_token_expiry:
+            raise Exception("SAS token is expired")
 
-        resource_uri = self.get_resource_uri()
+    def get_resource_uri(self) -> str:
+        return _get_resource_uri(self.storage_account, self.container)
 
-        wildcard = ""
-        if self.use_wildcard == True:
-            wildcard = "*"
+    def __str__(self) -> str:
+        """
+        Creates the remote location url with sas token to be used for the final location
+        """
+        wildcard = "*" if self.use_wildcard else ""
+        resource_uri = _get_resource_uri(self.storage_account, self.container)
 
-        return resource_uri + self.path + wildcard + "?" + self.sas_token
+        # Creating the url with a single f-string instead of
+        # concatenating the resource uri with each part
+        return f"{resource_uri}{self.path}{wildcard}?{self._sas_token}"
 
 
 class AzLocalLocation:
@@ -92,22 +149,120 @@ class AzLocalLocation:
         self.location_type = location_type
 
     def __str__(self) -> str:
-        wildcard = ""
-        if self.use_wildcard == True:
-            wildcard = "*"
+        # Returning the path itself when there is no wildcard,
+        # instead of creating a new string for every command
+        if self.use_wildcard:
+            return self.path + "*"
+
+        return self.path
+
 
-        return self.path + wildcard
+# Options passed to azcopy copy to not overwrite the existing files
+_OVERWRITE_FALSE = ("--overwrite", "false")
+# Option passed to azcopy copy to copy the contents of a folder source
+# directly into the destination. Boolean flags only take a value with =
+_AS_SUBDIR_FALSE = "--as-subdir=false"
 
+# Options shared by the copy, sync and remove options tables
+# Look into subdirectories recursively when transferring or removing
+_RECURSIVE_OPTION = ("recursive", "--recursive", False)
+# Create an MD5 hash of each file, and save the hash as the Content-MD5 property
+# of the destination blob or file.
+_PUT_MD5_OPTION = ("put_md5", "--put-md5", False)
+# Exclude these paths when transferring.
+_EXCLUDE_PATH_OPTION = ("exclude_path", "--exclude-path", True)
 
-class AzCopyOptions:
+
+class _AzOptions:
+    """
+    Base class for the azcopy options classes
+    The options list is generated once and reused for the next commands
+    until any of the options are changed
+    """
+
+    __slots__ = ("_options_cache",)
+
+    # Options of the class as (attribute, azcopy flag, takes value), in the
+    # order in which they are passed to azcopy. The flag is passed if the
+    # attribute is set, followed by the attribute value if the flag takes one
+    _OPTIONS_TABLE: Tuple[Tuple[str, str, bool], ...] = ()
+
+    _options_cache: Optional[Tuple[str, ...]]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+
+        # Changing any option invalidates the cached options list
+        if name != "_options_cache":
+            super().__setattr__("_options_cache", None)
+
+    def _get_option_fragment(
+        self, attribute: str, flag: str, takes_value: bool
+    ) -> Tuple[str, ...]:
+        """
+        Returns the arguments of an option, which are empty if the option is not set
+        """
+        value = getattr(self, attribute)
+
+        if not value:
+            return ()
+
+        return (flag, value) if takes_value else (flag,)
+
+    def _build_options_list(self) -> List[str]:
+        # Joining the arguments of all the options
+        # at once instead of appending them one by one
+        return list(
+            chain.from_iterable(
+                self._get_option_fragment(attribute, flag, takes_value)
+                for attribute, flag, takes_value in self._OPTIONS_TABLE
+            )
+        )
+
+    def get_options_list(self) -> List[str]:
+        """
+        Returns the options to be passed to the azcopy command
+        A new list is returned on every call, so the callers can modify it
+        without changing the cached options
+        """
+        options_cache = getattr(self, "_options_cache", None)
+
+        if options_cache is None:
+            options_cache = tuple(self._build_options_list())
+            self._options_cache = options_cache
+
+        return list(options_cache)
+
+
+class AzCopyOptions(_AzOptions):
     """
     Class to give specific options for data transfer using Azcopy
     """
 
+    __slots__ = (
+        "overwrite_existing",
+        "recursive",
+        "put_md5",
+        "exclude_path",
+        "list_of_files",
+        "as_subdir",
+    )
+
+    _OPTIONS_TABLE = (
+        _RECURSIVE_OPTION,
+        # Only available for uploading
+        _PUT_MD5_OPTION,
+        _EXCLUDE_PATH_OPTION,
+        # List of files to be copied from the source
+        ("list_of_files", "--list-of-files", True),
+    )
+
     overwrite_existing: bool
     recursive: bool
     put_md5: bool
     exclude_path: str
+    list_of_files: Optional[str]
+    as_subdir: bool
 
     def __init__(
         self,
@@ -115,43 +270,135 @@ class AzCopyOptions:
         recursive: bool = False,
         put_md5: bool = False,
         exclude_path: str = "",
+        list_of_files: Optional[str] = None,
+        as_subdir: bool = True,
     ) -> None:
         self.overwrite_existing = overwrite_existing
         self.recursive = recursive
         self.put_md5 = put_md5
         self.exclude_path = exclude_path
+        self.list_of_files = list_of_files
+        self.as_subdir = as_subdir
 
-    def get_options_list(self) -> List[str]:
-        transfer_options = []
-
-        # Look into subdirectories recursively when transferring
-        if self.recursive:
-            transfer_options.append("--recursive")
+    def _build_options_list(self) -> List[str]:
+        transfer_options = super()._build_options_list()
 
         # Overwrite the conflicting files and blobs at the destination if this flag is set to true. (default true)
         if not self.overwrite_existing:
-            transfer_options.append("--overwrite")
-            transfer_options.append("false")
+            transfer_options.extend(_OVERWRITE_FALSE)
 
-        # Create an MD5 hash of each file, and save the hash as the Content-MD5 property
-        # of the destination blob or file.
-        # Only available for uploading
-        if self.put_md5:
-            transfer_options.append("--put-md5")
-
-        # Exclude these paths when copying.
-        if len(self.exclude_path) > 0:
-            transfer_options.append("--exclude-path")
-            transfer_options.append(self.exclude_path)
+        # Places folder sources as subdirectories under the destination. (default true)
+        if not self.as_subdir:
+            transfer_options.append(_AS_SUBDIR_FALSE)
 
         return transfer_options
 
 
-class AzSyncOptions:
+class AzCopyBatch:
+    """
+    Collects the files to be copied with AzClient.run_copy_batch
+    The files having the same source folder and destination are
+    copied with a single azcopy job using the --list-of-files option
+    """
+
+    __slots__ = ("transfer_options", "_groups")
+
+    transfer_options: AzCopyOptions
+
+    def __init__(
+        self,
+        transfer_options: AzCopyOptions,
+        pairs: Optional[
+            Iterable[
+                Tuple[
+                    Union[AzRemoteSASLocation, AzLocalLocation],
+                    Union[AzRemoteSASLocation, AzLocalLocation],
+                ]
+            ]
+        ] = None,
+    ) -> None:
+        self.transfer_options = transfer_options
+
+        # Source folder, destination and relative file paths of each
+        # group, keyed by the source folder and destination strings
+        self._groups: Dict[
+            Tuple[str, str],
+            Tuple[
+                Union[AzRemoteSASLocation, AzLocalLocation],
+                Union[AzRemoteSASLocation, AzLocalLocation],
+                List[str],
+            ],
+        ] = {}
+
+        if pairs is not None:
+            for src, dest in pairs:
+                self.add(src, dest)
+
+    def add(
+        self,
+        src: Union[AzRemoteSASLocation, AzLocalLocation],
+        dest: Union[AzRemoteSASLocation, AzLocalLocation],
+    ) -> None:
+        """
+        Adds a file to the batch
+        The source is the location of the file and the destination is the
+        folder where the file is copied, as when copying the file on its own
+        """
+        if src.use_wildcard:
+            raise Exception("Wildcard locations cannot be copied in a batch")
+
+        src_folder: Union[AzRemoteSASLocation, AzLocalLocation]
+
+        if isinstance(src, AzRemoteSASLocation):
+            folder, _, file_path = src.path.rpartition("/")
+            src_folder = AzRemoteSASLocation(
+                storage_account=src.storage_account,
+                container=src.container,
+                path=folder + "/" if folder else "",
+                sas_token=src.sas_token,
+                location_type=src.location_type,
+            )
+        else:
+            folder, file_path = os.path.split(src.path)
+            src_folder = AzLocalLocation(
+                path=folder or os.curdir, location_type=src.location_type
+            )
+
+        # The location strings are created once per file, to find the group
+        key = (str(src_folder), str(dest))
+        group = self._groups.get(key)
+
+        if group is None:
+            group = (src_folder, dest, [])
+            self._groups[key] = group
+
+        group[2].append(file_path)
+
+    def get_groups(
+        self,
+    ) -> List[
+        Tuple[
+            Union[AzRemoteSASLocation, AzLocalLocation],
+            Union[AzRemoteSASLocation, AzLocalLocation],
+            List[str],
+        ]
+    ]:
+        """
+        Returns the source folder, destination and the file
+        paths relative to the source folder for each group
+        """
+        return list(self._groups.values())
+
+
+class AzSyncOptions(_AzOptions):
     """
     Class to give specific options for data transfer using Azcopy
     """
 
+    __slots__ = ("recursive", "put_md5", "exclude_path")
+
+    _OPTIONS_TABLE = (_RECURSIVE_OPTION, _PUT_MD5_OPTION, _EXCLUDE_PATH_OPTION)
+
     recursive: bool
     put_md5: bool
     exclude_path: str
@@ -166,145 +413,155 @@ class AzSyncOptions:
         self.put_md5 = put_md5
         self.exclude_path = exclude_path
 
-    def get_options_list(self) -> List[str]:
-        transfer_options = []
 
-        # Look into subdirectories recursively when transferring
-        if self.recursive:
-            transfer_options.append("--recursive")
+# The job info dataclasses are compared and hashed by identity, as the
+# plain classes were, and store their fields in slots when it is
+# supported by dataclasses (python 3.10+)
+_DATACLASS_OPTIONS = {"eq": False}
 
-        # Create an MD5 hash of each file, and save the hash as the Content-MD5 property
-        # of the destination blob or file.
-        if self.put_md5:
-            transfer_options.append("--put-md5")
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS["slots"] = True
 
-        if len(self.exclude_path) > 0:
-            transfer_options.append("--exclude-path")
-            transfer_options.append(self.exclude_path)
 
-        return transfer_options
+class _AzJobInfo:
+    """
+    Base class for the job info classes
+    The job info attributes are stored in slots instead of
+    an instance dict, as a job info is created for every job
+    """
+
+    __slots__ = ()
 
+    # Attributes which are left out of __dict__
+    _HIDDEN_ATTRIBUTES: Tuple[str, ...] = ()
 
-class AzCopyJobInfo:
+    @property
+    def __dict__(self) -> Dict[str, Any]:  # type: ignore
+        """
+        Returns the job info attributes as a dict, so that
+        job_info.__dict__ and vars(job_info) keep working
+        """
+        return {
+            name: getattr(self, name)
+            for name in type(self).__slots__
+            if name not in self._HIDDEN_ATTRIBUTES
+        }
+
+
+class _AzProgressJobInfo(_AzJobInfo):
     """
-    Created the job info of the Azcopy job executed by the user
+    Base class for the job infos of the jobs which send their progress
+    The percent complete history is stored as basis points (percent * 100)
+    in an unsigned short array, as azcopy sends the percent with at most
+    two decimals. This takes 2 bytes per value instead of a float object
+
+    The history is stored in a slot of this class, so that it is left out
+    of the job info __dict__ also when the dataclasses don't use slots
     """
 
-    percent_complete: float
-    error_msg: str
-    number_of_file_transfers: int
-    number_of_folder_property_transfers: int
-    total_number_of_transfers: int
-    number_of_transfers_completed: int
-    number_of_transfers_failed: int
-    number_of_transfers_skipped: int
-    total_bytes_transferred: int
-    final_job_status_msg: str
-    completed: bool
+    __slots__ = ("percent_history_bp",)
 
-    def __init__(
-        self,
-        percent_complete: float = float(0),
-        error_msg: str = "",
-        final_job_status_msg: str = "",
-        number_of_file_transfers: int = 0,
-        number_of_folder_property_transfers: int = 0,
-        total_number_of_transfers: int = 0,
-        number_of_transfers_completed: int = 0,
-        number_of_transfers_failed: int = 0,
-        number_of_transfers_skipped: int = 0,
-        total_bytes_transferred: int = 0,
-        completed: bool = False,
-    ) -> None:
-        # NOTE: Sometimes, azcopy doesn't return value as 100%
-        # even if the entire data is transferred.
-        # This might be because if the transfer is completed in between
-        # the value sent by azcopy, then azcopy fails to send the final
-        # percent value and directly sends the job summary
-        self.percent_complete = percent_complete
-        self.error_msg = error_msg
-        self.final_job_status_msg = final_job_status_msg
-        self.number_of_file_transfers = number_of_file_transfers
-        self.number_of_folder_property_transfers = number_of_folder_property_transfers
-        self.total_number_of_transfers = total_number_of_transfers
-        self.number_of_transfers_completed = number_of_transfers_completed
-        self.number_of_transfers_failed = number_of_transfers_failed
-        self.number_of_transfers_skipped = number_of_transfers_skipped
-        self.total_bytes_transferred = total_bytes_transferred
-        self.completed = completed
+    _HIDDEN_ATTRIBUTES = ("percent_history_bp",)
 
+    percent_history_bp: array
 
-class AzSyncJobInfo:
+    def get_percent_history(self) -> List[float]:
+        """
+        Returns the percent complete values sent by azcopy during the job
+        """
+        return [percent_bp / 100 for percent_bp in self.percent_history_bp]
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class AzCopyJobInfo(_AzProgressJobInfo):
     """
     Created the job info of the Azcopy job executed by the user
     """
 
-    percent_complete: float
-    error_msg: str
-    files_scanned_at_source: int
-    files_scanned_at_destination: int
-    # elapsed_time_minutes: float
-    number_of_copy_transfers_for_files: int
-    number_of_copy_transfers_for_folder_properties: int
-    number_of_folder_property_transfers: int
-    total_number_of_copy_transfers: int
-    number_of_copy_transfers_completed: int
-    number_of_copy_transfers_failed: int
-    number_of_deletions_at_destination: int
-    total_number_of_bytes_transferred: int
-    total_number_of_bytes_enumerated: int
-    final_job_status_msg: str
-    completed: bool
-
-    def __init__(
-        self,
-        percent_complete: float = float(0),
-        error_msg: str = "",
-        files_scanned_at_source: int = 0,
-        files_scanned_at_destination: int = 0,
-        # elapsed_time_minutes: float = float(0),
-        number_of_copy_transfers_for_files: int = 0,
-        number_of_copy_transfers_for_folder_properties: int = 0,
-        number_of_folder_property_transfers: int = 0,
-        total_number_of_copy_transfers: int = 0,
-        number_of_copy_transfers_completed: int = 0,
-        number_of_copy_transfers_failed: int = 0,
-        number_of_deletions_at_destination: int = 0,
-        total_number_of_bytes_transferred: int = 0,
-        total_number_of_bytes_enumerated: int = 0,
-        final_job_status_msg: str = "",
-        completed: bool = False,
-    ) -> None:
-        # NOTE: Sometimes, azcopy doesn't return value as 100%
-        # even if the entire data is transferred.
-        # This might be because if the transfer is completed in between
-        # the value sent by azcopy, then azcopy fails to send the final
-        # percent value and directly sends the job summary
-        self.percent_complete = percent_complete
-        self.error_msg = error_msg
-        self.final_job_status_msg = final_job_status_msg
-        self.files_scanned_at_source = files_scanned_at_source
-        self.files_scanned_at_destination = files_scanned_at_destination
-        # self.elapsed_time_minutes = elapsed_time_minutes
-        self.number_of_copy_transfers_for_files = number_of_copy_transfers_for_files
-        self.number_of_copy_transfers_for_folder_properties = (
-            number_of_copy_transfers_for_folder_properties
-        )
-        self.number_of_folder_property_transfers = number_of_folder_property_transfers
-        self.total_number_of_copy_transfers = total_number_of_copy_transfers
-        self.number_of_copy_transfers_completed = number_of_copy_transfers_completed
-        self.number_of_copy_transfers_failed = number_of_copy_transfers_failed
-        self.number_of_deletions_at_destination = number_of_deletions_at_destination
-        self.total_number_of_bytes_transferred = total_number_of_bytes_transferred
-        self.total_number_of_bytes_enumerated = total_number_of_bytes_enumerated
-        self.completed = completed
-
+    # NOTE: Sometimes, azcopy doesn't return value as 100%
+    # even if the entire data is transferred.
+    # This might be because if the transfer is completed in between
+    # the value sent by azcopy, then azcopy fails to send the final
+    # percent value and directly sends the job summary
+    percent_complete: float = float(0)
+    error_msg: str = ""
+    final_job_status_msg: str = ""
+    number_of_file_transfers: int = 0
+    number_of_folder_property_transfers: int = 0
+    total_number_of_transfers: int = 0
+    number_of_transfers_completed: int = 0
+    number_of_transfers_failed: int = 0
+    number_of_transfers_skipped: int = 0
+    total_bytes_transferred: int = 0
+    completed: bool = False
+    # Percent complete values sent by azcopy during the job, in basis points
+    percent_history_bp: array = field(
+        default_factory=lambda: array("H"), repr=False, compare=False
+    )
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class AzSyncJobInfo(_AzProgressJobInfo):
+    """
+    Created the job info of the Azcopy job executed by the user
+    """
 
-class AzListOptions:
+    # NOTE: Sometimes, azcopy doesn't return value as 100%
+    # even if the entire data is transferred.
+    # This might be because if the transfer is completed in between
+    # the value sent by azcopy, then azcopy fails to send the final
+    # percent value and directly sends the job summary
+    percent_complete: float = float(0)
+    error_msg: str = ""
+    files_scanned_at_source: int = 0
+    files_scanned_at_destination: int = 0
+    # elapsed_time_minutes: float = float(0)
+    number_of_copy_transfers_for_files: int = 0
+    number_of_copy_transfers_for_folder_properties: int = 0
+    number_of_folder_property_transfers: int = 0
+    total_number_of_copy_transfers: int = 0
+    number_of_copy_transfers_completed: int = 0
+    number_of_copy_transfers_failed: int = 0
+    number_of_deletions_at_destination: int = 0
+    total_number_of_bytes_transferred: int = 0
+    total_number_of_bytes_enumerated: int = 0
+    final_job_status_msg: str = ""
+    completed: bool = False
+    # Percent complete values sent by azcopy during the job, in basis points
+    percent_history_bp: array = field(
+        default_factory=lambda: array("H"), repr=False, compare=False
+    )
+
+
+class AzListOptions(_AzOptions):
     """
     Class to give specific options for listing files using Azcopy list command
     """
 
+    __slots__ = (
+        "_properties",
+        "_properties_arg",
+        "output_type",
+        "output_level",
+        "machine_readable",
+        "mega_units",
+        "running_tally",
+        "trailing_dot",
+    )
+
+    _OPTIONS_TABLE = (
+        # Output level
+        ("output_level", "--output-level", True),
+        # Machine readable format
+        ("machine_readable", "--machine-readable", False),
+        # Mega units (1000 instead of 1024)
+        ("mega_units", "--mega-units", False),
+        # Count files and total size
+        ("running_tally", "--running-tally", False),
+        # Trailing dot handling
+        ("trailing_dot", "--trailing-dot", True),
+    )
+
     properties: Optional[str]
     output_type: str
     output_level: Optional[str]
@@ -331,49 +588,48 @@ class AzListOptions:
         self.running_tally = running_tally
         self.trailing_dot = trailing_dot
 
-    def get_options_list(self) -> List[str]:
+    @property
+    def properties(self) -> Optional[str]:
+        return self._properties
+
+    @properties.setter
+    def properties(self, properties: Optional[str]) -> None:
+        # The quoted properties argument is created once when the properties
+        # are set, instead of every time the options list is built
+        self._properties = properties
+        self._properties_arg = f'"{properties}"' if properties else None
+
+    def _build_options_list(self) -> List[str]:
         list_options = []
 
         # Specify properties to display (semicolon separated in double quotes)
-        if self.properties:
+        if self._properties_arg:
             list_options.append("--properties")
-            list_options.append(f'"{self.properties}"')
+            list_options.append(self._properties_arg)
 
         # Output format type
         if self.output_type != "text":
             list_options.append("--output-type")
             list_options.append(self.output_type)
 
-        # Output level
-        if self.output_level:
-            list_options.append("--output-level")
-            list_options.append(self.output_level)
-
-        # Machine readable format
-        if self.machine_readable:
-            list_options.append("--machine-readable")
-
-        # Mega units (1000 instead of 1024)
-        if self.mega_units:
-            list_options.append("--mega-units")
-
-        # Count files and total size
-        if self.running_tally:
-            list_options.append("--running-tally")
-
-        # Trailing dot handling
-        if self.trailing_dot:
-            list_options.append("--trailing-dot")
-            list_options.append(self.trailing_dot)
+        list_options.extend(super()._build_options_list())
 
         return list_options
 
 
-class AzListJobInfo:
+class AzListJobInfo(_AzJobInfo):
     """
     Store the result information from azcopy list command
     """
 
+    __slots__ = (
+        "error_msg",
+        "final_job_status_msg",
+        "completed",
+        "output_text",
+        "items",
+    )
+
     error_msg: str
     final_job_status_msg: str
     completed: bool
@@ -395,11 +651,49 @@ class AzListJobInfo:
         self.items = items or []
 
 
-class AzRemoveOptions:
+class AzRemoveOptions(_AzOptions):
     """
     Class to give specific options for data removal using Azcopy remove command
     """
 
+    __slots__ = (
+        "recursive",
+        "include_pattern",
+        "exclude_pattern",
+        "dry_run",
+        "delete_snapshots",
+        "list_of_files",
+        "list_of_versions",
+        "force_if_read_only",
+        "permanent_delete",
+        "include_after",
+        "include_before",
+    )
+
+    _OPTIONS_TABLE = (
+        _RECURSIVE_OPTION,
+        # Include only files whose names match the pattern
+        ("include_pattern", "--include-pattern", True),
+        # Exclude files whose names match the pattern
+        ("exclude_pattern", "--exclude-pattern", True),
+        # Show what would be removed without actually removing
+        ("dry_run", "--dry-run", False),
+        # Delete snapshots (include, only, none)
+        ("delete_snapshots", "--delete-snapshots", True),
+        # List of files to be removed from the source
+        ("list_of_files", "--list-of-files", True),
+        # List of versions to be removed from the source
+        ("list_of_versions", "--list-of-versions", True),
+        # Force remove even if the file is read-only
+        ("force_if_read_only", "--force-if-read-only", False),
+        # Delete permanently without moving to recycle bin
+        ("permanent_delete", "--permanent-delete", False),
+        # Include only files whose last modified time is on or after the given value
+        ("include_after", "--include-after", True),
+        # Include only files whose last modified time is on or before the given value
+        ("include_before", "--include-before", True),
+    )
+
     recursive: bool
     include_pattern: Optional[str]
     exclude_pattern: Optional[str]
@@ -438,102 +732,25 @@ class AzRemoveOptions:
         self.include_after = include_after
         self.include_before = include_before
 
-    def get_options_list(self) -> List[str]:
-        remove_options = []
-
-        # Look into subdirectories recursively when removing
-        if self.recursive:
-            remove_options.append("--recursive")
-
-        # Include only files whose names match the pattern
-        if self.include_pattern:
-            remove_options.append("--include-pattern")
-            remove_options.append(self.include_pattern)
-
-        # Exclude files whose names match the pattern
-        if self.exclude_pattern:
-            remove_options.append("--exclude-pattern")
-            remove_options.append(self.exclude_pattern)
-
-        # Show what would be removed without actually removing
-        if self.dry_run:
-            remove_options.append("--dry-run")
-
-        # Delete snapshots (include, only, none)
-        if self.delete_snapshots:
-            remove_options.append("--delete-snapshots")
-            remove_options.append(self.delete_snapshots)
-
-        # List of files to be removed from the source
-        if self.list_of_files:
-            remove_options.append("--list-of-files")
-            remove_options.append(self.list_of_files)
-
-        # List of versions to be removed from the source
-        if self.list_of_versions:
-            remove_options.append("--list-of-versions")
-            remove_options.append(self.list_of_versions)
 
-        # Force remove even if the file is read-only
-        if self.force_if_read_only:
-            remove_options.append("--force-if-read-only")
-
-        # Delete permanently without moving to recycle bin
-        if self.permanent_delete:
-            remove_options.append("--permanent-delete")
-
-        # Include only files whose last modified time is on or after the given value
-        if self.include_after:
-            remove_options.append("--include-after")
-            remove_options.append(self.include_after)
-
-        # Include only files whose last modified time is on or before the given value
-        if self.include_before:
-            remove_options.append("--include-before")
-            remove_options.append(self.include_before)
-
-        return remove_options
-
-
-class AzRemoveJobInfo:
+@dataclass(**_DATACLASS_OPTIONS)
+class AzRemoveJobInfo(_AzProgressJobInfo):
     """
     Store the job info of the Azcopy remove job executed by the user
     """
 
-    percent_complete: float
-    error_msg: str
-    final_job_status_msg: str
-    completed: bool
-    number_of_files_removed: int
-    number_of_folders_removed: int
-    total_number_of_removals: int
-    number_of_removals_completed: int
-    number_of_removals_failed: int
-    number_of_removals_skipped: int
-    total_bytes_removed: int
-
-    def __init__(
-        self,
-        percent_complete: float = float(0),
-        error_msg: str = "",
-        final_job_status_msg: str = "",
-        completed: bool = False,
-        number_of_files_removed: int = 0,
-        number_of_folders_removed: int = 0,
-        total_number_of_removals: int = 0,
-        number_of_removals_completed: int = 0,
-        number_of_removals_failed: int = 0,
-        number_of_removals_skipped: int = 0,
-        total_bytes_removed: int = 0,
-    ) -> None:
-        self.percent_complete = percent_complete
-        self.error_msg = error_msg
-        self.final_job_status_msg = final_job_status_msg
-        self.completed = completed
-        self.number_of_files_removed = number_of_files_removed
-        self.number_of_folders_removed = number_of_folders_removed
-        self.total_number_of_removals = total_number_of_removals
-        self.number_of_removals_completed = number_of_removals_completed
-        self.number_of_removals_failed = number_of_removals_failed
-        self.number_of_removals_skipped = number_of_removals_skipped
-        self.total_bytes_removed = total_bytes_removed
+    percent_complete: float = float(0)
+    error_msg: str = ""
+    final_job_status_msg: str = ""
+    completed: bool = False
+    number_of_files_removed: int = 0
+    number_of_folders_removed: int = 0
+    total_number_of_removals: int = 0
+    number_of_removals_completed: int = 0
+    number_of_removals_failed: int = 0
+    number_of_removals_skipped: int = 0
+    total_bytes_removed: int = 0
+    # Percent complete values sent by azcopy during the job, in basis points
+    percent_history_bp: array = field(
+        default_factory=lambda: array("H"), repr=False, compare=False
+    )
@@ -1,33 +1,46 @@
 import time
 import datetime
-from urllib.parse import parse_qs
+from functools import lru_cache
+from urllib.parse import unquote
 
 
-def is_sas_token_session_expired(token: str) -> bool:
+@lru_cache(maxsize=128)
+def get_sas_token_expiry_timestamp(token: str) -> int:
     """
-    Checks if the SAS token is expired
+    Gets the session expiry of the SAS token as unix timestamp
+    The result is cached as the same token is usually used for many commands
     """
-    parsed = parse_qs(token.lstrip("?"))
+    session_expiry_string = ""
 
     # se is the query parameter for SessionExpiry field
-    session_expiry = parsed.get("se")
+    # Only this parameter is unquoted, instead of parsing the whole query
+    for query_parameter in token.lstrip("?").split("&"):
+        if query_parameter.startswith("se="):
+            session_expiry_string = unquote(query_parameter[3:])
+            break
 
-    if session_expiry is None:
+    if not session_expiry_string:
         raise Exception("Cannot find session expiry parameter in query")
 
-    session_expiry_string = session_expiry[0]
-
-    session_expiry_unix_timestamp = int(
-        time.mktime(
-            datetime.datetime.strptime(
-                session_expiry_string, "%Y-%m-%dT%H:%M:%SZ"
-            ).timetuple()
-        )
+    # The session expiry is in UTC, for ex. 2023-01-01T00:00:00Z
+    # fromisoformat only accepts the Z suffix from python 3.11
+    session_expiry = datetime.datetime.fromisoformat(
+        session_expiry_string.replace("Z", "+00:00")
     )
 
-    current_timestamp = datetime.datetime.now(datetime.timezone.utc)
+    if session_expiry.tzinfo is None:
+        session_expiry = session_expiry.replace(tzinfo=datetime.timezone.utc)
+
+    return int(session_expiry.timestamp())
+
+
+def is_sas_token_session_expired(token: str) -> bool:
+    """
+    Checks if the SAS token is expired
+    """
+    session_expiry_unix_timestamp = get_sas_token_expiry_timestamp(token)
 
-    current_unix_timestamp = int(time.mktime(current_timestamp.timetuple()))
+    current_unix_timestamp = int(time.time())
 
     if current_unix_timestamp > session_expiry_unix_timestamp:
         return True
@@ -2,3 +2,8 @@ import os
 
 DEFAULT_EXE_TO_USE = "azcopy"
 ARTEFACE_DIR = None  # type: ignore
+
+# Maximum number of azcopy jobs run in parallel by the async methods of AzClient,
+# which can be changed with the MAX_PARALLEL_JOBS_ENV environment variable
+DEFAULT_MAX_PARALLEL_JOBS = 4
+MAX_PARALLEL_JOBS_ENV = "AZCOPY_WRAPPER_MAX_PARALLEL"
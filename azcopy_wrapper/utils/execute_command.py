@@ -1,12 +1,31 @@
 import os
+import re
 import subprocess
 
 from typing import List, Generator
 
+# Number of bytes read from the output pipe at once
+READ_CHUNK_SIZE = 65536
+
+# Line breaks of the output, which are all translated to \n in the
+# same way as a text mode pipe. azcopy can separate the progress
+# updates with a lone \r
+_LINE_BREAK_RE = re.compile(rb"\r\n|\r|\n")
+
+
+def _decode_line(line: bytes) -> str:
+    """
+    Decodes an output line, without its line break
+    """
+    return line.decode("utf-8", "replace")
+
 
 def execute_command(cmd: List[str]) -> Generator[str, None, None]:
     """
     Executes a command while simultaneously sending output.
+
+    The output is read from the pipe in binary chunks, and every
+    complete line in the chunk is decoded once before sending it
     """
     print(f"Executing command -> {' '.join(cmd)}")
 
@@ -14,13 +33,44 @@ def execute_command(cmd: List[str]) -> Generator[str, None, None]:
         cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        universal_newlines=True,
         env=os.environ.copy(),
     )
 
     if popen.stdout is not None:
-        for stdout_line in iter(popen.stdout.readline, ""):
-            yield stdout_line
+        stdout_fd = popen.stdout.fileno()
+        buffer = bytearray()
+
+        while True:
+            chunk = os.read(stdout_fd, READ_CHUNK_SIZE)
+
+            if not chunk:
+                break
+
+            buffer += chunk
+
+            # Sending all the complete lines in the buffer and
+            # keeping the incomplete last line for the next chunk
+            line_start = 0
+
+            for line_break in _LINE_BREAK_RE.finditer(buffer):
+                # A \r at the end of the buffer can be the first half
+                # of a \r\n split between chunks, so it is kept
+                # until the next chunk is read
+                if line_break.end() == len(buffer) and buffer[-1:] == b"\r":
+                    break
+
+                yield _decode_line(buffer[line_start : line_break.start()]) + "\n"
+
+                line_start = line_break.end()
+
+            del buffer[:line_start]
+
+        # Sending the last line, which is either a line ending
+        # with \r or a line without any line break
+        if buffer.endswith(b"\r"):
+            yield _decode_line(buffer[:-1]) + "\n"
+        elif buffer:
+            yield _decode_line(buffer)
 
         popen.stdout.close()
         return_code = popen.wait()
@@ -20,7 +20,8 @@ setup(
     author_email="yashmarathe21@gmail.com",
     keywords="azcopy wrapper python azure storage bulk upload blob sync copy",
     license="MIT",
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     packages=["azcopy_wrapper", "azcopy_wrapper/utils/"],
     install_requires=[],
+    extras_require={"orjson": ["orjson"]},
 )
@@ -0,0 +1,167 @@
+import json
+import sys
+
+import pytest
+
+from azcopy_wrapper import AzClient, AzLocalLocation, AzRemoteSASLocation
+
+SAS_TOKEN = "sv=2021-08-06&se=2099-01-01T00:00:00Z&sp=rl&sig=abc"
+
+_FAKE_AZCOPY = """#!{python}
+import json
+import os
+import sys
+
+state_dir = {state_dir!r}
+calls_file = os.path.join(state_dir, "calls.jsonl")
+
+with open(calls_file, "a+", encoding="utf-8") as f:
+    f.seek(0)
+    call_index = len(f.readlines())
+
+    args = sys.argv[1:]
+    list_of_files = None
+
+    if "--list-of-files" in args:
+        with open(args[args.index("--list-of-files") + 1], encoding="utf-8") as list_file:
+            list_of_files = list_file.read()
+
+    f.write(json.dumps({{"args": args, "list_of_files": list_of_files}}) + "\\n")
+
+with open(os.path.join(state_dir, "jobs.json"), encoding="utf-8") as f:
+    jobs = json.load(f)
+
+output, exit_code = jobs[min(call_index, len(jobs) - 1)]
+
+sys.stdout.buffer.write(output.encode("utf-8"))
+sys.exit(exit_code)
+"""
+
+
+def job_output(
+    command="cp",
+    final_job_status="Completed",
+    percents=("0.0", "45.5", "100.0"),
+    transfers=2,
+    failed=0,
+    skipped=0,
+    line_ending="\n",
+    summary_keyword="summary",
+):
+    """
+    Returns an output like the one azcopy sends for a copy, sync or remove job
+    """
+    lines = [
+        "INFO: Scanning...",
+        "",
+        "Job 1234-abcd has started",
+        "Log file is located at: /tmp/1234-abcd.log",
+        "",
+    ]
+    lines.extend(
+        f"{percent} %, 0 Done, 0 Failed, {transfers} Pending, 0 Skipped, "
+        f"{transfers} Total, 2-sec Throughput (Mb/s): 0"
+        for percent in percents
+    )
+    lines.extend(["", "", f"Job 1234-abcd {summary_keyword}"])
+    lines.append("Elapsed Time (Minutes): 0.0334")
+
+    completed = transfers - failed - skipped
+
+    if command == "sync":
+        lines.extend(
+            [
+                f"Files Scanned at Source: {transfers}",
+                "Files Scanned at Destination: 1",
+                f"Number of Copy Transfers for Files: {transfers}",
+                "Number of Copy Transfers for Folder Properties: 0",
+                f"Total Number Of Copy Transfers: {transfers}",
+                f"Number of Copy Transfers Completed: {completed}",
+                f"Number of Copy Transfers Failed: {failed}",
+                "Number of Deletions at Destination: 0",
+                "Total Number of Bytes Transferred: 2048",
+                "Total Number of Bytes Enumerated: 2048",
+            ]
+        )
+    elif command == "remove":
+        lines.extend(
+            [
+                f"Number of Files Removed: {completed}",
+                "Number of Folders Removed: 0",
+                f"Total Number of Removals: {transfers}",
+                f"Number of Removals Completed: {completed}",
+                f"Number of Removals Failed: {failed}",
+                f"Number of Removals Skipped: {skipped}",
+                "TotalBytesRemoved: 2048",
+            ]
+        )
+    else:
+        lines.extend(
+            [
+                f"Number of File Transfers: {transfers}",
+                "Number of Folder Property Transfers: 0",
+                f"Total Number of Transfers: {transfers}",
+                f"Number of Transfers Completed: {completed}",
+                f"Number of Transfers Failed: {failed}",
+                f"Number of Transfers Skipped: {skipped}",
+                "TotalBytesTransferred: 2048",
+            ]
+        )
+
+    lines.extend([f"Final Job Status: {final_job_status}", ""])
+
+    return line_ending.join(lines)
+
+
+class FakeAzcopy:
+    """
+    Fake azcopy executable which records its arguments and
+    sends the outputs given to set_jobs, one for each call
+    """
+
+    def __init__(self, state_dir):
+        self.state_dir = state_dir
+        self.exe = state_dir / "azcopy"
+        self.exe.write_text(
+            _FAKE_AZCOPY.format(python=sys.executable, state_dir=str(state_dir))
+        )
+        self.exe.chmod(0o755)
+        self.client = AzClient(exe_to_use=str(self.exe))
+        self.set_jobs(job_output())
+
+    def set_jobs(self, *outputs, exit_code=0):
+        jobs = [[output, exit_code] for output in outputs]
+        (self.state_dir / "jobs.json").write_text(json.dumps(jobs))
+
+    @property
+    def calls(self):
+        calls_file = self.state_dir / "calls.jsonl"
+
+        if not calls_file.exists():
+            return []
+
+        return [json.loads(line) for line in calls_file.read_text().splitlines()]
+
+
+@pytest.fixture
+def fake_azcopy(tmp_path):
+    # The fake azcopy is a python script run through its shebang line
+    if sys.platform == "win32":
+        pytest.skip("The fake azcopy executable needs a shebang line")
+
+    return FakeAzcopy(tmp_path)
+
+
+@pytest.fixture
+def remote_location():
+    return AzRemoteSASLocation(
+        storage_account="account",
+        container="container",
+        path="folder/",
+        sas_token=SAS_TOKEN,
+    )
+
+
+@pytest.fixture
+def local_location(tmp_path):
+    return AzLocalLocation(path=str(tmp_path))
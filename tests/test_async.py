@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from azcopy_wrapper import (
+    AzClient,
+    AzCopyOptions,
+    AzListOptions,
+    AzRemoveOptions,
+    AzSyncOptions,
+)
+from azcopy_wrapper.azcopy_client import _get_max_parallel_jobs
+from azcopy_wrapper.utils.constants import (
+    DEFAULT_MAX_PARALLEL_JOBS,
+    MAX_PARALLEL_JOBS_ENV,
+)
+
+from conftest import job_output
+
+
+class _ConcurrencyTracker:
+    """
+    Blocking job which records how many jobs run at the same time
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.finished = []
+
+    def __call__(self, name, duration=0.05):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+
+        time.sleep(duration)
+
+        with self.lock:
+            self.running -= 1
+            self.finished.append(name)
+
+        return name
+
+
+def test_async_methods_run_the_jobs(fake_azcopy, remote_location, local_location):
+    client = fake_azcopy.client
+    fake_azcopy.set_jobs(job_output(command="sync", summary_keyword="Summary"))
+
+    async def run_jobs():
+        return await asyncio.gather(
+            client.download_data_to_local_location_async(
+                src=remote_location,
+                dest=local_location,
+                transfer_options=AzCopyOptions(),
+            ),
+            client.sync_to_local_location_async(
+                src=remote_location,
+                dest=local_location,
+                transfer_options=AzSyncOptions(),
+            ),
+            client.list_remote_location_async(
+                location=remote_location, list_options=AzListOptions()
+            ),
+            client.remove_from_remote_location_async(
+                location=remote_location, remove_options=AzRemoveOptions()
+            ),
+        )
+
+    job_infos = asyncio.run(run_jobs())
+
+    assert [job_info.completed for job_info in job_infos] == [True] * 4
+    assert sorted(call["args"][0] for call in fake_azcopy.calls) == [
+        "cp",
+        "list",
+        "remove",
+        "sync",
+    ]
+
+
+def test_async_jobs_are_limited_by_the_environment(monkeypatch):
+    monkeypatch.setenv(MAX_PARALLEL_JOBS_ENV, "2")
+    client = AzClient()
+    tracker = _ConcurrencyTracker()
+
+    async def run_jobs():
+        return await asyncio.gather(
+            *(client._run_async(tracker, name=i) for i in range(6))
+        )
+
+    assert asyncio.run(run_jobs()) == list(range(6))
+    assert tracker.max_running == 2
+
+
+def test_cancelled_async_job_keeps_its_slot_until_it_finishes(monkeypatch):
+    monkeypatch.setenv(MAX_PARALLEL_JOBS_ENV, "1")
+    client = AzClient()
+    tracker = _ConcurrencyTracker()
+
+    async def run_jobs():
+        first_job = asyncio.ensure_future(
+            client._run_async(tracker, name="cancelled", duration=0.2)
+        )
+        await asyncio.sleep(0.05)
+        first_job.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await first_job
+
+        # The cancelled job is still running in its thread, so the next
+        # job waits for it to finish
+        return await client._run_async(tracker, name="next")
+
+    assert asyncio.run(run_jobs()) == "next"
+    assert tracker.max_running == 1
+    assert tracker.finished == ["cancelled", "next"]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, DEFAULT_MAX_PARALLEL_JOBS),
+        ("8", 8),
+        ("0", DEFAULT_MAX_PARALLEL_JOBS),
+        ("many", DEFAULT_MAX_PARALLEL_JOBS),
+    ],
+)
+def test_get_max_parallel_jobs(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv(MAX_PARALLEL_JOBS_ENV, raising=False)
+    else:
+        monkeypatch.setenv(MAX_PARALLEL_JOBS_ENV, value)
+
+    if value in ("0", "many"):
+        with pytest.warns(UserWarning, match=MAX_PARALLEL_JOBS_ENV):
+            assert _get_max_parallel_jobs() == expected
+    else:
+        assert _get_max_parallel_jobs() == expected
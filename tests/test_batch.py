@@ -0,0 +1,224 @@
+import os
+
+import pytest
+
+from azcopy_wrapper import (
+    AzClient,
+    AzCopyBatch,
+    AzCopyJobInfo,
+    AzCopyOptions,
+    AzLocalLocation,
+    AzRemoteSASLocation,
+    AzRemoveOptions,
+)
+from azcopy_wrapper.azcopy_client import _merge_copy_job_infos
+
+from conftest import SAS_TOKEN, job_output
+
+
+def _remote_file(path):
+    return AzRemoteSASLocation(
+        storage_account="account",
+        container="container",
+        path=path,
+        sas_token=SAS_TOKEN,
+    )
+
+
+def test_batch_copy_passes_the_paths_in_a_list_of_files(
+    fake_azcopy, remote_location, local_location
+):
+    transfer_options = AzCopyOptions()
+    paths = ["a.txt", "sub folder/b.txt", "été.txt"]
+
+    job_info = fake_azcopy.client.batch_copy(
+        remote_location, local_location, paths, transfer_options
+    )
+
+    assert job_info.completed
+    assert job_info.total_number_of_transfers == 2
+
+    call = fake_azcopy.calls[0]
+    # The list of files is written as utf-8 whatever the locale encoding is
+    assert call["list_of_files"] == "a.txt\nsub folder/b.txt\nété.txt"
+
+    list_of_files = call["args"][call["args"].index("--list-of-files") + 1]
+    assert not os.path.exists(list_of_files)
+
+    # The options given by the caller are not changed
+    assert transfer_options.list_of_files is None
+    assert "--list-of-files" not in transfer_options.get_options_list()
+
+
+def test_batch_copy_writes_the_list_of_files_in_the_artefact_dir(
+    fake_azcopy, remote_location, local_location, tmp_path
+):
+    artefact_dir = tmp_path / "artefacts"
+    artefact_dir.mkdir()
+    client = AzClient(exe_to_use=str(fake_azcopy.exe), artefact_dir=str(artefact_dir))
+
+    client.batch_copy(remote_location, local_location, ["a.txt"], AzCopyOptions())
+
+    args = fake_azcopy.calls[0]["args"]
+    list_of_files = args[args.index("--list-of-files") + 1]
+    assert os.path.dirname(list_of_files) == str(artefact_dir)
+    assert os.listdir(artefact_dir) == []
+
+
+def test_batch_copy_removes_the_list_of_files_when_the_job_fails(
+    fake_azcopy, remote_location, local_location
+):
+    fake_azcopy.set_jobs(job_output(final_job_status="Failed", failed=1))
+
+    with pytest.raises(Exception, match="Tranfers failed = 1"):
+        fake_azcopy.client.batch_copy(
+            remote_location, local_location, ["a.txt"], AzCopyOptions()
+        )
+
+    args = fake_azcopy.calls[0]["args"]
+    assert not os.path.exists(args[args.index("--list-of-files") + 1])
+
+
+def test_batch_remove_passes_the_paths_in_a_list_of_files(
+    fake_azcopy, remote_location
+):
+    fake_azcopy.set_jobs(job_output(command="remove"))
+    remove_options = AzRemoveOptions()
+
+    job_info = fake_azcopy.client.batch_remove(
+        remote_location, ["a.txt", "b/c.txt"], remove_options
+    )
+
+    assert job_info.completed
+    assert job_info.total_number_of_removals == 2
+
+    call = fake_azcopy.calls[0]
+    assert call["args"][0] == "remove"
+    assert call["list_of_files"] == "a.txt\nb/c.txt"
+    assert not os.path.exists(call["args"][call["args"].index("--list-of-files") + 1])
+    assert remove_options.list_of_files is None
+
+
+def test_copy_batch_groups_files_by_source_folder_and_destination(tmp_path):
+    dest = AzLocalLocation(path=str(tmp_path))
+    other_dest = AzLocalLocation(path=str(tmp_path / "other"))
+
+    batch = AzCopyBatch(
+        AzCopyOptions(),
+        [
+            (_remote_file("x/a.txt"), dest),
+            (_remote_file("x/b.txt"), dest),
+            (_remote_file("y/c.txt"), dest),
+            (_remote_file("top.txt"), dest),
+            (_remote_file("x/d.txt"), other_dest),
+        ],
+    )
+
+    groups = [(src.path, str(dest), paths) for src, dest, paths in batch.get_groups()]
+
+    assert groups == [
+        ("x/", str(tmp_path), ["a.txt", "b.txt"]),
+        ("y/", str(tmp_path), ["c.txt"]),
+        ("", str(tmp_path), ["top.txt"]),
+        ("x/", str(tmp_path / "other"), ["d.txt"]),
+    ]
+
+
+def test_copy_batch_rejects_wildcard_locations(local_location):
+    batch = AzCopyBatch(AzCopyOptions())
+    src = _remote_file("x/")
+    src.use_wildcard = True
+
+    with pytest.raises(Exception, match="Wildcard"):
+        batch.add(src, local_location)
+
+
+def test_run_copy_batch_copies_each_file_directly_into_its_destination(
+    fake_azcopy, local_location
+):
+    batch = AzCopyBatch(AzCopyOptions())
+    batch.add(_remote_file("x/a.txt"), local_location)
+    batch.add(_remote_file("x/b.txt"), local_location)
+    batch.add(_remote_file("y/c.txt"), local_location)
+
+    fake_azcopy.client.run_copy_batch(batch)
+
+    calls = fake_azcopy.calls
+    assert len(calls) == 2
+    assert [call["list_of_files"] for call in calls] == ["a.txt\nb.txt", "c.txt"]
+    assert [call["args"][1] for call in calls] == [
+        "https://account.blob.core.windows.net/container/x/?" + SAS_TOKEN,
+        "https://account.blob.core.windows.net/container/y/?" + SAS_TOKEN,
+    ]
+
+    # The files of a group would be copied under a subfolder named after
+    # their source folder without --as-subdir=false
+    for call in calls:
+        assert "--as-subdir=false" in call["args"]
+
+    # The options of the batch are not changed
+    assert "--as-subdir=false" not in batch.transfer_options.get_options_list()
+
+
+def test_run_copy_batch_sums_the_job_counters(fake_azcopy, local_location):
+    fake_azcopy.set_jobs(
+        job_output(transfers=2, percents=("50.0", "100.0")),
+        job_output(transfers=3, skipped=1, final_job_status="CompletedWithSkipped"),
+    )
+    batch = AzCopyBatch(AzCopyOptions())
+    batch.add(_remote_file("x/a.txt"), local_location)
+    batch.add(_remote_file("y/b.txt"), local_location)
+
+    job_info = fake_azcopy.client.run_copy_batch(batch)
+
+    assert job_info.completed
+    assert job_info.final_job_status_msg == "CompletedWithSkipped"
+    assert job_info.total_number_of_transfers == 5
+    assert job_info.number_of_transfers_completed == 4
+    assert job_info.number_of_transfers_skipped == 1
+    assert job_info.total_bytes_transferred == 4096
+    assert job_info.get_percent_history() == [50.0, 100.0, 0.0, 45.5, 100.0]
+
+
+def test_run_copy_batch_stops_at_the_first_failed_job(fake_azcopy, local_location):
+    fake_azcopy.set_jobs(job_output(final_job_status="Failed", failed=2), job_output())
+    batch = AzCopyBatch(AzCopyOptions())
+    batch.add(_remote_file("x/a.txt"), local_location)
+    batch.add(_remote_file("y/b.txt"), local_location)
+
+    with pytest.raises(Exception, match="Tranfers failed = 2"):
+        fake_azcopy.client.run_copy_batch(batch)
+
+    assert len(fake_azcopy.calls) == 1
+
+
+@pytest.mark.parametrize(
+    "statuses, completed, expected_status",
+    [
+        ([], True, "Completed"),
+        ([("Completed", True), ("Completed", True)], True, "Completed"),
+        (
+            [("CompletedWithSkipped", True), ("Completed", True)],
+            True,
+            "CompletedWithSkipped",
+        ),
+        (
+            [("Completed", True), ("Failed", False), ("CompletedWithSkipped", True)],
+            False,
+            "Failed",
+        ),
+        ([("Completed", True), ("Unknown", False)], False, "Unknown"),
+    ],
+)
+def test_merge_copy_job_infos_derives_the_completed_flag_and_worst_status(
+    statuses, completed, expected_status
+):
+    job_infos = [
+        AzCopyJobInfo(final_job_status_msg=status, completed=job_completed)
+        for status, job_completed in statuses
+    ]
+
+    merged_job_info = _merge_copy_job_infos(job_infos)
+
+    assert merged_job_info.completed is completed
+    assert merged_job_info.final_job_status_msg == expected_status
@@ -0,0 +1,168 @@
+import pytest
+
+from azcopy_wrapper import AzCopyOptions, AzRemoveOptions, AzSyncOptions
+
+from conftest import SAS_TOKEN, job_output
+
+_AUTHENTICATION_FAILED_OUTPUT = (
+    "INFO: Scanning...\n"
+    "Failed to perform copy: RESPONSE 403: AuthenticationFailed "
+    "Server failed to authenticate the request\n"
+)
+
+
+def test_copy_parses_the_progress_and_job_summary(
+    fake_azcopy, remote_location, local_location
+):
+    job_info = fake_azcopy.client.download_data_to_local_location(
+        remote_location, local_location, AzCopyOptions()
+    )
+
+    assert job_info.completed
+    assert job_info.error_msg == ""
+    assert job_info.final_job_status_msg == "Completed"
+    assert job_info.percent_complete == 100.0
+    assert job_info.number_of_file_transfers == 2
+    assert job_info.total_number_of_transfers == 2
+    assert job_info.number_of_transfers_completed == 2
+    assert job_info.total_bytes_transferred == 2048
+
+    assert fake_azcopy.calls[0]["args"] == [
+        "cp",
+        "https://account.blob.core.windows.net/container/folder/?" + SAS_TOKEN,
+        local_location.path,
+        "--overwrite",
+        "false",
+    ]
+
+
+@pytest.mark.parametrize("line_ending", ["\r\n", "\r"])
+def test_copy_parses_output_with_carriage_returns(
+    fake_azcopy, remote_location, local_location, line_ending
+):
+    fake_azcopy.set_jobs(job_output(line_ending=line_ending))
+
+    job_info = fake_azcopy.client.download_data_to_local_location(
+        remote_location, local_location, AzCopyOptions()
+    )
+
+    assert job_info.completed
+    assert job_info.final_job_status_msg == "Completed"
+    assert job_info.get_percent_history() == [0.0, 45.5, 100.0]
+    assert job_info.number_of_transfers_completed == 2
+
+
+def test_copy_keeps_the_history_of_the_changed_percent_values(
+    fake_azcopy, remote_location, local_location
+):
+    fake_azcopy.set_jobs(
+        job_output(percents=("0.0", "0.0", "12.34", "12.34", "100.0", "700.0"))
+    )
+
+    job_info = fake_azcopy.client.download_data_to_local_location(
+        remote_location, local_location, AzCopyOptions()
+    )
+
+    assert job_info.percent_complete == 700.0
+    # The history is clamped to 100 %, the range of its unsigned short array
+    assert job_info.get_percent_history() == [0.0, 12.34, 100.0, 100.0]
+
+
+def test_copy_raises_when_transfers_failed(
+    fake_azcopy, remote_location, local_location
+):
+    fake_azcopy.set_jobs(job_output(final_job_status="Failed", failed=1))
+
+    with pytest.raises(Exception, match="Tranfers failed = 1"):
+        fake_azcopy.client.download_data_to_local_location(
+            remote_location, local_location, AzCopyOptions()
+        )
+
+
+def test_copy_reports_authentication_errors(
+    fake_azcopy, remote_location, local_location
+):
+    fake_azcopy.set_jobs(_AUTHENTICATION_FAILED_OUTPUT)
+
+    with pytest.raises(Exception, match="AuthenticationFailed") as exc_info:
+        fake_azcopy.client.download_data_to_local_location(
+            remote_location, local_location, AzCopyOptions()
+        )
+
+    assert str(exc_info.value).endswith("; Error while transferring data")
+
+
+def test_copy_reports_the_command_error(fake_azcopy, remote_location, local_location):
+    fake_azcopy.set_jobs("INFO: Scanning...\n", exit_code=1)
+
+    with pytest.raises(Exception, match="returned non-zero exit status 1"):
+        fake_azcopy.client.download_data_to_local_location(
+            remote_location, local_location, AzCopyOptions()
+        )
+
+
+def test_sync_detects_the_capitalised_job_summary(
+    fake_azcopy, remote_location, local_location
+):
+    fake_azcopy.set_jobs(job_output(command="sync", summary_keyword="Summary"))
+
+    job_info = fake_azcopy.client.sync_to_local_location(
+        remote_location, local_location, AzSyncOptions()
+    )
+
+    assert job_info.completed
+    assert job_info.final_job_status_msg == "Completed"
+    assert job_info.percent_complete == 100.0
+    assert job_info.files_scanned_at_source == 2
+    assert job_info.files_scanned_at_destination == 1
+    assert job_info.total_number_of_copy_transfers == 2
+    assert job_info.number_of_copy_transfers_completed == 2
+    assert job_info.total_number_of_bytes_transferred == 2048
+    assert fake_azcopy.calls[0]["args"][0] == "sync"
+
+
+def test_sync_raises_when_transfers_failed(
+    fake_azcopy, remote_location, local_location
+):
+    fake_azcopy.set_jobs(
+        job_output(
+            command="sync",
+            summary_keyword="Summary",
+            final_job_status="Failed",
+            failed=2,
+        )
+    )
+
+    with pytest.raises(Exception, match="Tranfers failed = 2"):
+        fake_azcopy.client.sync_to_local_location(
+            remote_location, local_location, AzSyncOptions()
+        )
+
+
+def test_remove_parses_the_job_summary(fake_azcopy, remote_location):
+    fake_azcopy.set_jobs(job_output(command="remove", transfers=3, skipped=1))
+
+    job_info = fake_azcopy.client.remove_from_remote_location(
+        remote_location, AzRemoveOptions(recursive=True)
+    )
+
+    assert job_info.completed
+    assert job_info.percent_complete == 100.0
+    assert job_info.number_of_files_removed == 2
+    assert job_info.total_number_of_removals == 3
+    assert job_info.number_of_removals_skipped == 1
+    assert job_info.total_bytes_removed == 2048
+    assert fake_azcopy.calls[0]["args"] == [
+        "remove",
+        "https://account.blob.core.windows.net/container/folder/?" + SAS_TOKEN,
+        "--recursive",
+    ]
+
+
+def test_remove_reports_authentication_errors(fake_azcopy, remote_location):
+    fake_azcopy.set_jobs(_AUTHENTICATION_FAILED_OUTPUT)
+
+    with pytest.raises(Exception, match="AuthenticationFailed"):
+        fake_azcopy.client.remove_from_remote_location(
+            remote_location, AzRemoveOptions()
+        )
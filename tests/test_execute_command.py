@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import pytest
+
+from azcopy_wrapper.utils import execute_command as execute_command_module
+from azcopy_wrapper.utils.execute_command import execute_command
+
+
+def _write_command(output, exit_code=0):
+    return [
+        sys.executable,
+        "-c",
+        f"import sys; sys.stdout.buffer.write({output!r}); sys.exit({exit_code})",
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 65536])
+@pytest.mark.parametrize(
+    "output, expected_lines",
+    [
+        (b"a\nb\n", ["a\n", "b\n"]),
+        (b"a\r\nb\r\n", ["a\n", "b\n"]),
+        (
+            b"0.0 %\r45.5 %\r100.0 %\r\ndone\n",
+            ["0.0 %\n", "45.5 %\n", "100.0 %\n", "done\n"],
+        ),
+        (b"a\r\rb\n\n", ["a\n", "\n", "b\n", "\n"]),
+        (b"last\r", ["last\n"]),
+        (b"no line break", ["no line break"]),
+        ("été\n".encode("utf-8"), ["été\n"]),
+        (b"", []),
+    ],
+)
+def test_execute_command_splits_lines_like_a_text_pipe(
+    monkeypatch, chunk_size, output, expected_lines
+):
+    # Small chunks split the \r\n and the utf-8 characters between reads
+    monkeypatch.setattr(execute_command_module, "READ_CHUNK_SIZE", chunk_size)
+
+    assert list(execute_command(_write_command(output))) == expected_lines
+
+
+def test_execute_command_raises_after_the_output_when_the_command_fails():
+    lines = []
+
+    with pytest.raises(subprocess.CalledProcessError):
+        for line in execute_command(_write_command(b"error\n", exit_code=1)):
+            lines.append(line)
+
+    assert lines == ["error\n"]
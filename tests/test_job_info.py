@@ -0,0 +1,50 @@
+import pytest
+
+from azcopy_wrapper import (
+    AzCopyJobInfo,
+    AzListJobInfo,
+    AzRemoveJobInfo,
+    AzSyncJobInfo,
+)
+
+_PROGRESS_JOB_INFO_CLASSES = [AzCopyJobInfo, AzSyncJobInfo, AzRemoveJobInfo]
+
+
+@pytest.mark.parametrize("job_info_class", _PROGRESS_JOB_INFO_CLASSES)
+def test_job_infos_are_hashed_and_compared_by_identity(job_info_class):
+    job_info = job_info_class()
+
+    assert job_info == job_info
+    assert job_info != job_info_class()
+    assert len({job_info, job_info_class()}) == 2
+
+
+@pytest.mark.parametrize("job_info_class", _PROGRESS_JOB_INFO_CLASSES)
+def test_percent_history_is_left_out_of_dict_and_repr(job_info_class):
+    job_info = job_info_class(percent_complete=50.0)
+    job_info.percent_history_bp.extend([0, 5000])
+
+    assert vars(job_info) == job_info.__dict__
+    assert job_info.__dict__["percent_complete"] == 50.0
+    assert "percent_history_bp" not in job_info.__dict__
+    assert "percent_history_bp" not in repr(job_info)
+    assert job_info.get_percent_history() == [0.0, 50.0]
+
+
+def test_job_infos_do_not_share_the_percent_history():
+    job_info = AzCopyJobInfo()
+    job_info.percent_history_bp.append(10000)
+
+    assert len(AzCopyJobInfo().percent_history_bp) == 0
+
+
+def test_list_job_info_dict():
+    job_info = AzListJobInfo(items=[{"Path": "a.txt"}])
+
+    assert job_info.__dict__ == {
+        "error_msg": "",
+        "final_job_status_msg": "",
+        "completed": False,
+        "output_text": "",
+        "items": [{"Path": "a.txt"}],
+    }
@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+from azcopy_wrapper import AzListOptions
+from azcopy_wrapper.azcopy_summary import get_list_text_items
+
+
+def _list_object_line(item):
+    return json.dumps(
+        {
+            "TimeStamp": "2024-01-01T00:00:00Z",
+            "MessageType": "ListObject",
+            "MessageContent": json.dumps(item),
+            "PromptDetails": {},
+        }
+    )
+
+
+def test_list_parses_the_json_output_while_streaming(fake_azcopy, remote_location):
+    fake_azcopy.set_jobs(
+        "\n".join(
+            [
+                _list_object_line({"Path": "a.txt", "ContentLength": "1024"}),
+                # Lines with leading whitespace are parsed as well
+                "  " + _list_object_line({"Path": "b/c.txt", "ContentLength": "0"}),
+                json.dumps({"MessageType": "Info", "MessageContent": "note"}),
+                "{not json}",
+                "INFO: not a JSON line",
+                json.dumps({"MessageType": "EndOfJob", "MessageContent": ""}),
+                "",
+            ]
+        )
+    )
+
+    job_info = fake_azcopy.client.list_remote_location(
+        remote_location, AzListOptions(output_type="json")
+    )
+
+    assert job_info.completed
+    assert job_info.final_job_status_msg == "Completed"
+    assert job_info.items == [
+        {"Path": "a.txt", "ContentLength": "1024"},
+        {"Path": "b/c.txt", "ContentLength": "0"},
+        {"MessageType": "Info", "MessageContent": "note"},
+    ]
+    assert "INFO: not a JSON line" in job_info.output_text.splitlines()
+    assert fake_azcopy.calls[0]["args"][-2:] == ["--output-type", "json"]
+
+
+def test_list_parses_the_text_output(fake_azcopy, remote_location):
+    fake_azcopy.set_jobs(
+        "INFO: a.txt;  Content Length: 1.00 KiB\r\n"
+        "INFO: b/c.txt;  Content Length: 0.00 B\r\n"
+    )
+
+    job_info = fake_azcopy.client.list_remote_location(
+        remote_location, AzListOptions()
+    )
+
+    assert job_info.completed
+    assert job_info.output_text == (
+        "INFO: a.txt;  Content Length: 1.00 KiB\n"
+        "INFO: b/c.txt;  Content Length: 0.00 B"
+    )
+    assert job_info.items == [
+        {"Path": "a.txt", "ContentLength": "1.00 KiB"},
+        {"Path": "b/c.txt", "ContentLength": "0.00 B"},
+    ]
+
+
+def test_list_raises_on_authentication_errors(fake_azcopy, remote_location):
+    fake_azcopy.set_jobs(
+        "RESPONSE 403: AuthenticationFailed Server failed to authenticate\n"
+    )
+
+    with pytest.raises(Exception, match="AuthenticationFailed"):
+        fake_azcopy.client.list_remote_location(remote_location, AzListOptions())
+
+
+@pytest.mark.parametrize(
+    "output_text, expected_items",
+    [
+        ("", []),
+        ("INFO: Listing...\n", []),
+        (
+            "INFO: a.txt;  Content Length: 1024\n",
+            [{"Path": "a.txt", "ContentLength": "1024"}],
+        ),
+        (
+            "INFO: folder/b c.txt; LastModifiedTime: 2024-01-01 00:00:00 +0000 GMT;"
+            " BlobType: BlockBlob; Content Length: 1.00 KiB  \n",
+            [
+                {
+                    "Path": "folder/b c.txt",
+                    "LastModifiedTime": "2024-01-01 00:00:00 +0000 GMT",
+                    "BlobType": "BlockBlob",
+                    "ContentLength": "1.00 KiB",
+                }
+            ],
+        ),
+        (
+            "INFO: a.txt;  Content Length: 1\nINFO: b.txt;  Content Length: 2",
+            [
+                {"Path": "a.txt", "ContentLength": "1"},
+                {"Path": "b.txt", "ContentLength": "2"},
+            ],
+        ),
+    ],
+)
+def test_get_list_text_items(output_text, expected_items):
+    assert get_list_text_items(output_text) == expected_items
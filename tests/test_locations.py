@@ -0,0 +1,61 @@
+import pytest
+
+from azcopy_wrapper import AzLocalLocation, AzRemoteSASLocation
+
+from conftest import SAS_TOKEN
+
+_EXPIRED_SAS_TOKEN = "sv=2021-08-06&se=2000-01-01T00:00:00Z&sp=rl&sig=abc"
+
+
+def test_remote_location_url():
+    location = AzRemoteSASLocation(
+        storage_account="account",
+        container="container",
+        path="folder/",
+        use_wildcard=True,
+        sas_token=SAS_TOKEN,
+    )
+
+    assert str(location) == (
+        "https://account.blob.core.windows.net/container/folder/*?" + SAS_TOKEN
+    )
+    assert location.get_resource_uri() == (
+        "https://account.blob.core.windows.net/container/"
+    )
+
+
+def test_remote_location_rejects_an_expired_sas_token():
+    with pytest.raises(Exception, match="SAS token is expired"):
+        AzRemoteSASLocation(sas_token=_EXPIRED_SAS_TOKEN)
+
+
+def test_refresh_sas_token_replaces_the_token_and_its_expiry():
+    location = AzRemoteSASLocation(sas_token=SAS_TOKEN)
+    location.sas_token = _EXPIRED_SAS_TOKEN
+
+    with pytest.raises(Exception, match="SAS token is expired"):
+        location.validate()
+
+    location.refresh_sas_token(SAS_TOKEN)
+
+    location.validate()
+    assert location.sas_token == SAS_TOKEN
+
+    with pytest.raises(Exception, match="SAS token is expired"):
+        location.refresh_sas_token(_EXPIRED_SAS_TOKEN)
+
+    assert location.sas_token == SAS_TOKEN
+
+
+def test_remote_location_without_sas_token_never_expires():
+    location = AzRemoteSASLocation()
+
+    location.validate()
+    assert str(location).endswith("?")
+
+
+@pytest.mark.parametrize(
+    "use_wildcard, expected", [(False, "/data/folder/"), (True, "/data/folder/*")]
+)
+def test_local_location_path(use_wildcard, expected):
+    assert str(AzLocalLocation("/data/folder/", use_wildcard=use_wildcard)) == expected